@@ -1,73 +1,124 @@
 import streamlit as st
 import sqlite3
 import os
+import time
+import threading
 from datetime import datetime, timedelta
 import hashlib
+import hmac
+import io
+from itertools import product
 import pandas as pd
 import altair as alt
-import matplotlib.pyplot as plt
+from PIL import Image, ImageOps, UnidentifiedImageError
 
 # ---------- Configuration ----------
 DB_PATH = "lostfound.db"
-IMAGES_DIR = "images"
 AUTO_ARCHIVE_DAYS = 30  # if not collected in this many days -> archived
+MAX_IMAGE_SIDE = 1024  # uploaded photos are downscaled to fit this box before storing
+AUTO_ARCHIVE_INTERVAL = 300  # seconds between auto-archive runs per session
+PAGE_SIZE = 20  # items per page in the student view
+MAX_IDS_PER_QUERY = 500  # IDs bound per IN (...) statement in batch admin actions
+SCRYPT_PARAMS = {"n": 2**14, "r": 8, "p": 1}
+INSERT_ITEM_SQL = "INSERT INTO items (description, found_location, collect_location, image_blob, uploaded_at, status, collected_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
 
 # ---------- Helpers ----------
-def ensure_dirs():
-    os.makedirs(IMAGES_DIR, exist_ok=True)
-
+@st.cache_resource
 def get_conn():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
-
+    # one shared connection per process so SQLite's page cache survives across reruns
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-64000;")
+    return conn
+
+@st.cache_resource
+def write_lock():
+    # the shared connection has one transaction state for all sessions, so every
+    # write block holds this lock to keep sessions from committing/rolling back each other
+    return threading.RLock()
+
+def db_mtime():
+    # used as a cache key so cached reads are dropped whenever the DB file changes
+    # (in WAL mode writes land in the -wal file until a checkpoint)
+    paths = [DB_PATH, DB_PATH + "-wal"]
+    return max((os.path.getmtime(p) for p in paths if os.path.exists(p)), default=0.0)
+
+def clear_item_cache():
+    _load_items.clear()
+    _count_items.clear()
+    _monthly_counts.clear()
+
+@st.cache_resource
 def init_db():
-    conn = get_conn()
-    cur = conn.cursor()
-    # Teachers table
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS teachers (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT UNIQUE NOT NULL,
-        password_hash TEXT NOT NULL
-    );
-    """)
-    # Items table
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS items (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        description TEXT,
-        found_location TEXT,
-        collect_location TEXT,
-        image_path TEXT,
-        uploaded_at TEXT,
-        status TEXT, -- 'lost', 'collected', 'archived'
-        collected_at TEXT
-    );
-    """)
-    conn.commit()
-    conn.close()
+    # schema setup runs once per process, not on every rerun
+    with write_lock():
+        conn = get_conn()
+        cur = conn.cursor()
+        # Teachers table
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS teachers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL
+        );
+        """)
+        # Items table
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            description TEXT,
+            found_location TEXT,
+            collect_location TEXT,
+            image_path TEXT, -- legacy on-disk images; new uploads use image_blob
+            uploaded_at TEXT,
+            status TEXT, -- 'lost', 'collected', 'archived'
+            collected_at TEXT,
+            image_blob BLOB
+        );
+        """)
+        # databases created before images were stored inline lack the blob column
+        cols = [r[1] for r in cur.execute("PRAGMA table_info(items);")]
+        if "image_blob" not in cols:
+            cur.execute("ALTER TABLE items ADD COLUMN image_blob BLOB;")
+        # serves both the status filter and ORDER BY uploaded_at DESC without a sort step
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_items_status_uploaded ON items(status, uploaded_at DESC);")
+        conn.commit()
+
+_sha256 = hashlib.sha256
 
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+    # scrypt with a per-user random salt, stored as "scrypt$<salt>$<hash>"
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode("utf-8"), salt=salt, **SCRYPT_PARAMS)
+    return f"scrypt${salt.hex()}${digest.hex()}"
+
+def check_password(password: str, stored: str) -> bool:
+    if stored.startswith("scrypt$"):
+        _, salt, _digest = stored.split("$")
+        candidate = hashlib.scrypt(password.encode("utf-8"), salt=bytes.fromhex(salt), **SCRYPT_PARAMS)
+        candidate = f"scrypt${salt}${candidate.hex()}"
+    else:
+        # legacy unsalted sha256 hex digest
+        candidate = _sha256(password.encode("utf-8")).digest().hex()
+    return hmac.compare_digest(candidate, stored)
 
 def check_teacher_exists():
     conn = get_conn()
     cur = conn.cursor()
     cur.execute("SELECT COUNT(*) FROM teachers;")
     c = cur.fetchone()[0]
-    conn.close()
     return c > 0
 
 def create_teacher(username, password):
     conn = get_conn()
-    cur = conn.cursor()
     ph = hash_password(password)
     try:
-        cur.execute("INSERT INTO teachers (username, password_hash) VALUES (?, ?)", (username, ph))
-        conn.commit()
+        with write_lock(), conn:
+            conn.execute("INSERT INTO teachers (username, password_hash) VALUES (?, ?)", (username, ph))
     except sqlite3.IntegrityError:
-        conn.close()
         return False, "Username already exists"
-    conn.close()
     return True, "Created"
 
 def verify_teacher(username, password):
@@ -75,94 +126,246 @@ def verify_teacher(username, password):
     cur = conn.cursor()
     cur.execute("SELECT password_hash FROM teachers WHERE username = ?", (username,))
     r = cur.fetchone()
-    conn.close()
-    if not r:
+    if not r or not check_password(password, r[0]):
         return False
-    return hash_password(password) == r[0]
-
-def save_image(uploaded_file):
-    # save to IMAGES_DIR with timestamp prefix + original name
-    ts = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
-    filename = f"{ts}_{uploaded_file.name}"
-    path = os.path.join(IMAGES_DIR, filename)
-    with open(path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-    return path
-
-def add_item(description, found_location, collect_location, image_path):
+    if not r[0].startswith("scrypt$"):
+        # upgrade legacy sha256 hashes on successful login
+        with write_lock(), conn:
+            conn.execute("UPDATE teachers SET password_hash = ? WHERE username = ?", (hash_password(password), username))
+    return True
+
+def _to_rgb(im):
+    # JPEG has no alpha channel; flatten transparent images onto white instead of black
+    if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+        im = im.convert("RGBA")
+        bg = Image.new("RGB", im.size, (255, 255, 255))
+        bg.paste(im, mask=im.getchannel("A"))
+        return bg
+    return im.convert("RGB")
+
+def encode_image(uploaded_file):
+    # re-encode to a bounded-size JPEG so it can be stored inline in the items table
+    uploaded_file.seek(0)
+    im = ImageOps.exif_transpose(Image.open(uploaded_file))
+    im.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+    buf = io.BytesIO()
+    _to_rgb(im).save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=500)
+def item_image(item_id):
+    # stored images never change after insert and ids are never reused,
+    # so the item id is a safe cache key
+    r = get_conn().execute("SELECT image_blob FROM items WHERE id = ?", (item_id,)).fetchone()
+    return r[0] if r else None
+
+@st.cache_data(max_entries=100, ttl=3600)
+def _legacy_image(path):
+    # legacy on-disk uploads are unresized, so cache them downscaled like new uploads;
+    # a missing or unreadable file raises, and exceptions are never cached
+    with open(path, "rb") as f:
+        return encode_image(f)
+
+def img_bytes(path):
+    # bytes of a legacy on-disk image, or None if it can't be read; passing bytes
+    # to st.image skips Streamlit re-hashing the file on every rerun
+    try:
+        return _legacy_image(path)
+    except (Image.DecompressionBombError, OSError):
+        return None
+
+def row_image(row):
+    # image bytes for a listed item: the stored blob, else the legacy image_path file
+    if row['has_image']:
+        return item_image(row['id'])
+    if row['image_path']:
+        return img_bytes(row['image_path'])
+    return None
+
+def _thumbnail(data, size):
+    im = Image.open(io.BytesIO(data))
+    im.thumbnail((size, size))
+    buf = io.BytesIO()
+    _to_rgb(im).save(buf, "JPEG")
+    return buf.getvalue()
+
+@st.cache_data(max_entries=500)
+def item_thumb(item_id, size=200):
+    data = item_image(item_id)
+    return _thumbnail(data, size) if data else None
+
+@st.cache_data(max_entries=500)
+def _legacy_thumb(path, size):
+    return _thumbnail(_legacy_image(path), size)
+
+def thumb(path, size=200):
+    # JPEG thumbnail bytes for a legacy image on disk, or None if it can't be read
+    try:
+        return _legacy_thumb(path, size)
+    except (Image.DecompressionBombError, OSError):
+        return None
+
+def row_thumb(row, size=200):
+    if row['has_image']:
+        return item_thumb(row['id'], size)
+    if row['image_path']:
+        return thumb(row['image_path'], size)
+    return None
+
+def add_item(description, found_location, collect_location, image_blob):
+    add_items_bulk([(description, found_location, collect_location, image_blob)])
+
+def add_items_bulk(rows):
+    # rows: iterable of (description, found_location, collect_location, image_blob);
+    # inserted with one prepared statement inside a single transaction
     conn = get_conn()
-    cur = conn.cursor()
     now = datetime.utcnow().isoformat()
-    cur.execute(
-        "INSERT INTO items (description, found_location, collect_location, image_path, uploaded_at, status, collected_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (description, found_location, collect_location, image_path, now, "lost", None)
-    )
-    conn.commit()
-    conn.close()
+    with write_lock(), conn:
+        conn.executemany(INSERT_ITEM_SQL, ((*row, now, "lost", None) for row in rows))
+    clear_item_cache()
 
-def get_items(status_filter=None, start_date=None, end_date=None):
-    conn = get_conn()
-    cur = conn.cursor()
-    q = "SELECT id, description, found_location, collect_location, image_path, uploaded_at, status, collected_at FROM items"
-    params = []
+def get_items(status_filter=None, start_date=None, end_date=None, limit=None, offset=0):
+    return _load_items(status_filter, start_date, end_date, limit, offset, db_mtime())
+
+def _items_where(by_status, by_start, by_end):
     clauses = []
-    if status_filter:
+    if by_status:
         clauses.append("status = ?")
+    # compare ISO strings directly instead of parsing every row with date()
+    if by_start:
+        clauses.append("uploaded_at >= ?")
+    if by_end:
+        clauses.append("uploaded_at < ?")
+    return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+# every filter combination is built once at import; keyed by (status, start, end[, limit]) presence
+_ITEMS_SQL = {
+    key: "SELECT id, description, found_location, collect_location, image_path, image_blob IS NOT NULL AS has_image, uploaded_at, status, collected_at FROM items"
+    + _items_where(*key[:3]) + " ORDER BY uploaded_at DESC" + (" LIMIT ? OFFSET ?" if key[3] else "")
+    for key in product((False, True), repeat=4)
+}
+_COUNT_SQL = {key: "SELECT COUNT(*) FROM items" + _items_where(*key) for key in product((False, True), repeat=3)}
+
+def _filter_params(status_filter, start_date, end_date):
+    params = []
+    if status_filter:
         params.append(status_filter)
     if start_date:
-        clauses.append("date(uploaded_at) >= date(?)")
         params.append(start_date.isoformat())
     if end_date:
-        clauses.append("date(uploaded_at) <= date(?)")
-        params.append(end_date.isoformat())
-    if clauses:
-        q += " WHERE " + " AND ".join(clauses)
-    q += " ORDER BY uploaded_at DESC"
-    cur.execute(q, tuple(params))
-    rows = cur.fetchall()
-    conn.close()
-    cols = ["id", "description", "found_location", "collect_location", "image_path", "uploaded_at", "status", "collected_at"]
-    df = pd.DataFrame(rows, columns=cols)
+        params.append((end_date + timedelta(days=1)).isoformat())
+    return params
+
+def _items_query(status_filter=None, start_date=None, end_date=None, limit=None, offset=0):
+    params = _filter_params(status_filter, start_date, end_date)
+    if limit is not None:
+        params += [limit, offset]
+    q = _ITEMS_SQL[(bool(status_filter), bool(start_date), bool(end_date), limit is not None)]
+    return q, tuple(params)
+
+@st.cache_data(ttl=60)
+def _load_items(status_filter, start_date, end_date, limit, offset, mtime):
+    q, params = _items_query(status_filter, start_date, end_date, limit, offset)
+    df = pd.read_sql_query(
+        q, get_conn(), params=params,
+        parse_dates={"uploaded_at": {"format": "ISO8601"}, "collected_at": {"format": "ISO8601"}}
+    )
     return df
 
+def stream_items(status_filter=None, start_date=None, end_date=None, limit=None, offset=0):
+    # yields sqlite3.Row objects for display loops that don't need a DataFrame
+    q, params = _items_query(status_filter, start_date, end_date, limit, offset)
+    cur = get_conn().cursor()
+    cur.row_factory = sqlite3.Row
+    yield from cur.execute(q, params)
+
+def count_items(status_filter=None, start_date=None, end_date=None):
+    return _count_items(status_filter, start_date, end_date, db_mtime())
+
+@st.cache_data(ttl=60)
+def _count_items(status_filter, start_date, end_date, mtime):
+    q = _COUNT_SQL[(bool(status_filter), bool(start_date), bool(end_date))]
+    return get_conn().execute(q, _filter_params(status_filter, start_date, end_date)).fetchone()[0]
+
+def monthly_counts():
+    return _monthly_counts(db_mtime())
+
+@st.cache_data(ttl=60)
+def _monthly_counts(mtime):
+    # aggregate in SQLite so only one row per month comes back
+    return pd.read_sql_query(
+        "SELECT substr(uploaded_at, 1, 7) AS ym, COUNT(*) AS count FROM items GROUP BY ym ORDER BY ym",
+        get_conn()
+    )
+
 def mark_collected(item_id):
     conn = get_conn()
-    cur = conn.cursor()
     now = datetime.utcnow().isoformat()
-    cur.execute("UPDATE items SET status = 'collected', collected_at = ? WHERE id = ?", (now, item_id))
-    conn.commit()
-    conn.close()
+    with write_lock(), conn:
+        conn.execute("UPDATE items SET status = 'collected', collected_at = ? WHERE id = ?", (now, item_id))
+    clear_item_cache()
 
 def archive_item(item_id):
     conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("UPDATE items SET status = 'archived' WHERE id = ?", (item_id,))
-    conn.commit()
-    conn.close()
+    with write_lock(), conn:
+        conn.execute("UPDATE items SET status = 'archived' WHERE id = ?", (item_id,))
+    clear_item_cache()
+
+def parse_ids(text):
+    # "3, 7,12" -> [3, 7, 12]; raises ValueError on anything that isn't a positive whole number
+    ids = list(dict.fromkeys(int(part) for part in text.split(",") if part.strip()))
+    if any(i <= 0 for i in ids):
+        raise ValueError("IDs must be positive")
+    return ids
+
+def _run_in_chunks(sql, ids):
+    # IN lists are split so no statement exceeds SQLite's host-parameter limit;
+    # all chunks share one transaction
+    conn = get_conn()
+    total = 0
+    with write_lock(), conn:
+        for start in range(0, len(ids), MAX_IDS_PER_QUERY):
+            chunk = ids[start:start + MAX_IDS_PER_QUERY]
+            total += conn.execute(sql + "(" + ",".join("?" * len(chunk)) + ")", chunk).rowcount
+    clear_item_cache()
+    return total
+
+def delete_items(ids):
+    return _run_in_chunks("DELETE FROM items WHERE id IN ", ids)
+
+def restore_items(ids):
+    return _run_in_chunks("UPDATE items SET status = 'lost' WHERE status = 'archived' AND id IN ", ids)
 
 def auto_archive():
     # find items with status 'lost' older than AUTO_ARCHIVE_DAYS and archive them
-    cutoff = datetime.utcnow() - timedelta(days=AUTO_ARCHIVE_DAYS)
+    # uploaded_at is stored as ISO 8601, which sorts lexicographically
+    cutoff = (datetime.utcnow() - timedelta(days=AUTO_ARCHIVE_DAYS)).isoformat()
     conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT id, uploaded_at FROM items WHERE status = 'lost'")
-    rows = cur.fetchall()
-    for r in rows:
-        item_id, uploaded_at = r
-        try:
-            up = datetime.fromisoformat(uploaded_at)
-        except Exception:
-            continue
-        if up < cutoff:
-            cur.execute("UPDATE items SET status = 'archived' WHERE id = ?", (item_id,))
-    conn.commit()
-    conn.close()
+    with write_lock(), conn:
+        cur = conn.execute("UPDATE items SET status = 'archived' WHERE status = 'lost' AND uploaded_at < ?", (cutoff,))
+    if cur.rowcount:
+        clear_item_cache()
+
+def render_monthly_chart():
+    # independent of the student filters; the data comes from the mtime-keyed cache
+    st.subheader("📊 Monthly Lost Items (last 12 months)")
+    monthly = monthly_counts()
+    if not monthly.empty:
+        chart = alt.Chart(monthly).mark_bar().encode(
+            x=alt.X('ym:N', title='Month'),
+            y=alt.Y('count:Q', title='Items')
+        ).properties(width=800, height=300)
+        st.altair_chart(chart)
+    else:
+        st.write("No data for chart.")
 
 # ---------- UI ----------
 st.set_page_config(page_title="Lost & Found Portal", layout="wide")
-ensure_dirs()
 init_db()
-auto_archive()  # run auto-archive on each load
+# run auto-archive at most once every AUTO_ARCHIVE_INTERVAL seconds instead of on every rerun
+if time.time() - st.session_state.get("last_archive", 0) > AUTO_ARCHIVE_INTERVAL:
+    auto_archive()
+    st.session_state["last_archive"] = time.time()
 
 st.title("🏷️ College Lost & Found Portal")
 
@@ -186,67 +389,55 @@ if mode == "Student (no login)":
             start_date = end_date = None
 
     status_map = {
-        "All current lost items": ("lost",),
-        "History (collected)": ("collected",),
-        "Archived": ("archived",)
+        "All current lost items": "lost",
+        "History (collected)": "collected",
+        "Archived": "archived"
     }
-    statuses = status_map[status_view]
-    # show items for each selected status
-    dfs = []
-    for s in statuses:
-        df = get_items(status_filter=s, start_date=start_date, end_date=end_date)
-        dfs.append(df)
-    if dfs:
-        df_all = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
-    else:
-        df_all = pd.DataFrame(columns=["id","description","found_location","collect_location","image_path","uploaded_at","status","collected_at"])
-
-    if df_all.empty:
+    status = status_map[status_view]
+    total = count_items(status_filter=status, start_date=start_date, end_date=end_date)
+    pages = max(1, -(-total // PAGE_SIZE))
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+    st.caption(f"{total} item(s) found")
+    # stream only the current page straight from the cursor
+    rows = stream_items(status_filter=status, start_date=start_date, end_date=end_date,
+                        limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE)
+
+    found = False
+    # Show details in a card-like list
+    for row in rows:
+        found = True
+        cols = st.columns([2,3,3,1])
+        with cols[0]:
+            st.markdown(f"**{row['description']}**")
+            st.write(f"Found at: {row['found_location']}")
+            st.write(f"Collect at: {row['collect_location']}")
+        with cols[1]:
+            st.write("Uploaded at:")
+            uploaded = row['uploaded_at']
+            st.write(uploaded[:10] if uploaded else "")
+            if row['status'] == 'collected':
+                st.success("✅ Collected")
+                st.write("Collected at:")
+                st.write(row['collected_at'][:10] if row['collected_at'] else "")
+            elif row['status'] == 'archived':
+                st.warning("📦 Archived")
+            else:
+                st.info("🔴 Currently available")
+        with cols[2]:
+            # image preview if exists
+            image = row_image(row)
+            if image:
+                st.image(image, width="stretch")
+            else:
+                st.write("No image")
+        with cols[3]:
+            st.write(f"ID: {row['id']}")
+        st.markdown("---")
+    if not found:
         st.info("No items found.")
-    else:
-        # Show details in a card-like list
-        for idx, row in df_all.iterrows():
-            cols = st.columns([2,3,3,1])
-            with cols[0]:
-                st.markdown(f"**{row['description']}**")
-                st.write(f"Found at: {row['found_location']}")
-                st.write(f"Collect at: {row['collect_location']}")
-            with cols[1]:
-                st.write("Uploaded at:")
-                uploaded = row['uploaded_at']
-                st.write(uploaded.split("T")[0] if uploaded else "")
-                if row['status'] == 'collected':
-                    st.success("✅ Collected")
-                    st.write("Collected at:")
-                    st.write(row['collected_at'].split("T")[0] if row['collected_at'] else "")
-                elif row['status'] == 'archived':
-                    st.warning("📦 Archived")
-                else:
-                    st.info("🔴 Currently available")
-            with cols[2]:
-                # image preview if exists
-                if pd.notna(row['image_path']) and row['image_path'] and os.path.exists(row['image_path']):
-                    st.image(row['image_path'], use_column_width=True)
-                else:
-                    st.write("No image")
-            with cols[3]:
-                st.write(f"ID: {row['id']}")
-            st.markdown("---")
 
     # Stats chart (simple monthly stats) - optional but helpful
-    st.subheader("📊 Monthly Lost Items (last 12 months)")
-    all_items = get_items()
-    if not all_items.empty:
-        all_items['uploaded_at_date'] = pd.to_datetime(all_items['uploaded_at']).dt.to_period("M").astype(str)
-        monthly = all_items.groupby('uploaded_at_date').size().reset_index(name='count')
-        monthly = monthly.sort_values('uploaded_at_date')
-        chart = alt.Chart(monthly).mark_bar().encode(
-            x=alt.X('uploaded_at_date:N', title='Month'),
-            y=alt.Y('count:Q', title='Items')
-        ).properties(width=800, height=300)
-        st.altair_chart(chart)
-    else:
-        st.write("No data for chart.")
+    render_monthly_chart()
 
 # ---------------- Teacher View ----------------
 else:
@@ -310,36 +501,43 @@ else:
                 if not desc or not found_loc or not collect_loc:
                     st.error("Please fill all text fields.")
                 else:
-                    image_path = None
+                    image_blob = None
+                    image_ok = True
                     if image_file:
-                        image_path = save_image(image_file)
-                    add_item(desc, found_loc, collect_loc, image_path)
-                    st.success("Item added successfully.")
+                        try:
+                            image_blob = encode_image(image_file)
+                        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+                            image_ok = False
+                            st.error("Could not read the photo. Please upload a valid PNG or JPEG image.")
+                    if image_ok:
+                        add_item(desc, found_loc, collect_loc, image_blob)
+                        st.success("Item added successfully.")
 
     # ----- Manage Items Tab -----
     with t2:
         st.subheader("🛠 Manage Current Lost Items")
-        df_lost = get_items(status_filter="lost")
-        if df_lost.empty:
+        found = False
+        for row in stream_items(status_filter="lost"):
+            found = True
+            c1, c2, c3 = st.columns([3,2,1])
+            with c1:
+                st.markdown(f"**{row['description']}**")
+                st.write(f"Found at: {row['found_location']}")
+                st.write(f"Collect at: {row['collect_location']}")
+            with c2:
+                st.write("Uploaded:")
+                st.write(row['uploaded_at'][:10] if row['uploaded_at'] else "")
+                thumbnail = row_thumb(row)
+                if thumbnail:
+                    st.image(thumbnail)
+            with c3:
+                if st.button(f"Mark Collected (ID {row['id']})", key=f"collect_{row['id']}"):
+                    mark_collected(row['id'])
+                    st.success("Marked as collected.")
+                    st.rerun()
+            st.markdown("---")
+        if not found:
             st.info("No current lost items.")
-        else:
-            for idx, row in df_lost.iterrows():
-                c1, c2, c3 = st.columns([3,2,1])
-                with c1:
-                    st.markdown(f"**{row['description']}**")
-                    st.write(f"Found at: {row['found_location']}")
-                    st.write(f"Collect at: {row['collect_location']}")
-                with c2:
-                    st.write("Uploaded:")
-                    st.write(row['uploaded_at'].split("T")[0] if row['uploaded_at'] else "")
-                    if pd.notna(row['image_path']) and row['image_path'] and os.path.exists(row['image_path']):
-                        st.image(row['image_path'], width=200)
-                with c3:
-                    if st.button(f"Mark Collected (ID {int(row['id'])})", key=f"collect_{int(row['id'])}"):
-                        mark_collected(int(row['id']))
-                        st.success("Marked as collected.")
-                        st.rerun()
-                st.markdown("---")
 
     # ----- History / Archive Tab -----
     with t3:
@@ -357,28 +555,30 @@ else:
             st.write("Admin actions")
             col_a, col_b = st.columns(2)
             with col_a:
-                delete_id = st.number_input("Delete item by ID (permanent)", min_value=1, step=1, value=1)
+                delete_ids = st.text_input("Delete item IDs (permanent, comma-separated)")
                 if st.button("Delete"):
-                    if delete_id > 0:
-                        conn = get_conn()
-                        cur = conn.cursor()
-                        cur.execute("DELETE FROM items WHERE id = ?", (delete_id,))
-                        conn.commit()
-                        conn.close()
-                        st.success("Deleted (if ID existed).")
-                        st.experimental_rerun()
+                    try:
+                        ids = parse_ids(delete_ids)
+                    except ValueError:
+                        st.error("IDs must be whole numbers separated by commas.")
+                    else:
+                        if ids:
+                            n = delete_items(ids)
+                            st.success(f"Deleted {n} item(s).")
+                            st.rerun()
             with col_b:
                 if tab_choice == "Archived":
-                    restore_id = st.number_input("Restore archived item ID to 'lost'", min_value=0, step=1, value=0, key="restoreid")
+                    restore_ids = st.text_input("Restore archived item IDs to 'lost' (comma-separated)", key="restoreid")
                     if st.button("Restore"):
-                        if restore_id > 0:
-                            conn = get_conn()
-                            cur = conn.cursor()
-                            cur.execute("UPDATE items SET status = 'lost' WHERE id = ?", (restore_id,))
-                            conn.commit()
-                            conn.close()
-                            st.success("Restored to lost.")
-                            st.experimental_rerun()
+                        try:
+                            ids = parse_ids(restore_ids)
+                        except ValueError:
+                            st.error("IDs must be whole numbers separated by commas.")
+                        else:
+                            if ids:
+                                n = restore_items(ids)
+                                st.success(f"Restored {n} item(s) to lost.")
+                                st.rerun()
 
     # ----- Account Tab -----
     with t4:
@@ -387,7 +587,7 @@ else:
         if st.button("Logout"):
             st.session_state.logged_in = False
             st.session_state.username = None
-            st.experimental_rerun()
+            st.rerun()
 
         st.markdown("---")
         st.write("Create additional teacher account (for demo/testing)")